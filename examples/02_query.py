@@ -4,33 +4,28 @@ Ejemplo de Consulta
 Demuestra cómo consultar la base de conocimiento usando RAG.
 """
 
-import asyncio
-import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _bootstrap import run
 
 from shadai import EmbeddingModel, LLMModel, Shadai
+from shadai.streaming import batched_stream
 from shadai.timing import timed
 
+SYSTEM_PROMPT = "Actua como un experto en el area de leyes y creatividad digital."
+
 
 @timed
 async def main() -> None:
     query = "De qué habla la quinta enmienda?"
 
-    system_prompt = """
-    Actua como un experto en el area de leyes y creatividad digital.
-    """
-
     async with Shadai(
         name="test",
         llm_model=LLMModel.GOOGLE_GEMINI_2_0_FLASH,
         embedding_model=EmbeddingModel.GOOGLE_GEMINI_EMBEDDING_001,
-        system_prompt=system_prompt,
+        system_prompt=SYSTEM_PROMPT,
     ) as shadai:
-        async for chunk in shadai.query(query=query):
+        async for chunk in batched_stream(shadai.query(query=query)):
             print(chunk, end="", flush=True)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
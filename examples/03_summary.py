@@ -8,74 +8,62 @@ Modos disponibles:
 2. Preguntas y respuestas: Usa el resumen para responder preguntas específicas
 """
 
-import asyncio
-import os
-import sys
+from typing import AsyncIterator
 
-from shadai.models import EmbeddingModel, LLMModel
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _bootstrap import run
 
 from shadai import Shadai
+from shadai.models import EmbeddingModel, LLMModel
+from shadai.streaming import batched_stream, gather_streams
 from shadai.timing import timed
 
+SYSTEM_PROMPT = "Actua como un experto en el area de leyes y creatividad digital."
 
-@timed
-async def example_direct_summary() -> None:
-    """Ejemplo 1: Obtener resumen directo (comportamiento por defecto)."""
-
-    system_prompt = """
-    Actua como un experto en el area de leyes y creatividad digital.
-    """
 
-    async with Shadai(
-        name="test",
-        llm_model=LLMModel.GOOGLE_GEMINI_2_0_FLASH,
-        embedding_model=EmbeddingModel.GOOGLE_GEMINI_EMBEDDING_001,
-        system_prompt=system_prompt,
-    ) as shadai:
-        async for chunk in shadai.summarize():
-            print(chunk, end="", flush=True)
-        print("\n")
+async def example_direct_summary(shadai: Shadai) -> AsyncIterator[str]:
+    """Ejemplo 1: Obtener resumen directo (comportamiento por defecto)."""
+    async for chunk in shadai.summarize():
+        yield chunk
+    yield "\n\n"
 
 
-@timed
-async def example_question_answering() -> None:
+async def example_question_answering(shadai: Shadai) -> AsyncIterator[str]:
     """Ejemplo 2: Hacer preguntas sobre el resumen."""
+    async for chunk in shadai.summarize(
+        prompt="¿Cuáles son los temas principales discutidos en los documentos?",
+        return_direct=False,
+        use_memory=False,
+    ):
+        yield chunk
+    yield "\n\n\n"
+
+    async for chunk in shadai.summarize(
+        prompt="¿Puedes profundizar más en el primer tema que mencionaste?",
+        return_direct=False,
+        use_memory=False,
+    ):
+        yield chunk
+    yield "\n\n"
 
-    system_prompt = """
-    Actua como un experto en el area de leyes y creatividad digital.
-    """
 
+@timed
+async def main() -> None:
+    """Ejecuta todos los ejemplos de forma concurrente sobre una sesión compartida."""
     async with Shadai(
         name="test",
         llm_model=LLMModel.GOOGLE_GEMINI_2_0_FLASH,
         embedding_model=EmbeddingModel.GOOGLE_GEMINI_EMBEDDING_001,
-        system_prompt=system_prompt,
+        system_prompt=SYSTEM_PROMPT,
     ) as shadai:
-        async for chunk in shadai.summarize(
-            prompt="¿Cuáles son los temas principales discutidos en los documentos?",
-            return_direct=False,
-            use_memory=False,
+        # Los ejemplos se ejecutan en paralelo y su salida se muestra en orden
+        async for chunk in batched_stream(
+            gather_streams(
+                example_direct_summary(shadai),
+                example_question_answering(shadai),
+            )
         ):
             print(chunk, end="", flush=True)
-        print("\n\n")
-
-        async for chunk in shadai.summarize(
-            prompt="¿Puedes profundizar más en el primer tema que mencionaste?",
-            return_direct=False,
-            use_memory=False,
-        ):
-            print(chunk, end="", flush=True)
-        print("\n")
-
-
-async def main() -> None:
-    """Ejecuta todos los ejemplos."""
-    await example_direct_summary()
-
-    await example_question_answering()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -6,22 +6,34 @@ Demonstrates the intelligent agent workflow with various scenarios:
 2. Complex market analysis with multiple data sources
 """
 
-import asyncio
-import os
-import sys
+import functools
+import inspect
+from types import MappingProxyType
+from typing import AsyncIterator, Mapping, Tuple
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from _bootstrap import run
 
 from shadai import Shadai, tool
 from shadai.models import EmbeddingModel, LLMModel
+from shadai.streaming import batched_stream, gather_streams
 from shadai.timing import timed
 
 # =============================================================================
 # Simple Agent Tools
 # =============================================================================
 
+USERS = (
+    "John Doe - Revenue: $50,000",
+    "Jane Smith - Revenue: $75,000",
+    "Bob Johnson - Revenue: $60,000",
+    "Alice Williams - Revenue: $85,000",
+    "Charlie Brown - Revenue: $55,000",
+)
+USER_LINES = tuple(f"  - {user}" for user in USERS)
+
 
 @tool
+@functools.lru_cache(maxsize=256)
 def search_database(query: str, limit: int = 10) -> str:
     """Search the internal user database for information and revenue data.
 
@@ -39,15 +51,8 @@ def search_database(query: str, limit: int = 10) -> str:
     Returns:
         Formatted string containing user records with names and revenue figures.
     """
-    users = [
-        "John Doe - Revenue: $50,000",
-        "Jane Smith - Revenue: $75,000",
-        "Bob Johnson - Revenue: $60,000",
-        "Alice Williams - Revenue: $85,000",
-        "Charlie Brown - Revenue: $55,000",
-    ]
     result = f"Database search for '{query}' (limit: {limit}):\n"
-    result += "\n".join(f"  - {u}" for u in users[:limit])
+    result += "\n".join(USER_LINES[:limit])
     return result
 
 
@@ -101,12 +106,165 @@ def send_email(recipient: str, subject: str, body: str) -> str:
     return f"✓ Email sent to {recipient}: {subject}"
 
 
+# =============================================================================
+# Market Analysis Data
+# =============================================================================
+
+
+def freeze(data: dict) -> Mapping[Tuple[str, str], str]:
+    """Flatten a two-level dataset into a read-only (key, name) -> text view."""
+    return MappingProxyType(
+        {
+            (key, name): inspect.cleandoc(text)
+            for key, value in data.items()
+            for name, text in value.items()
+        }
+    )
+
+
+_RAW_MARKET_DATA = {
+    "AI software": {
+        "global": """
+            Market Analysis for AI Software (Global):
+            - Market Size: $142.3 billion (2023)
+            - Growth Rate: 37.3% CAGR (2023-2030)
+            - Key Segments: Machine Learning (45%), NLP (28%), Computer Vision (27%)
+            - Top Players: OpenAI, Google, Microsoft, Anthropic
+            - Adoption Rate: 35% of enterprises have implemented AI solutions
+            - Investment: $93.5 billion in VC funding (2023)""",
+        "north america": """
+            Market Analysis for AI Software (North America):
+            - Market Size: $51.2 billion (2023)
+            - Growth Rate: 35.8% CAGR
+            - Leading Adopters: Technology (68%), Finance (52%), Healthcare (43%)
+            - Key Drivers: Digital transformation, automation, cost reduction
+        """,
+    }
+}
+
+
+_RAW_FEEDBACK_DATA = {
+    "AI software": {
+        "last quarter": """
+            Customer Feedback Analysis (Q4 2024):
+            Positive Feedback (78%):
+            - "Significantly improved productivity by 40%"
+            - "Easy integration with existing workflows"
+            - "Excellent accuracy in predictions"
+            - "Strong customer support and documentation"
+            - "Cost-effective compared to hiring additional staff"
+
+            Negative Feedback (22%):
+            - "Initial setup complexity"
+            - "Requires training for optimal use"
+            - "Some features have steep learning curve"
+            - "Occasional latency issues during peak hours"
+
+            Key Insights:
+            - Net Promoter Score (NPS): 67 (Excellent)
+            - Customer Satisfaction: 4.3/5.0
+            - Feature Requests: Better mobile support, more customization options
+            - Retention Rate: 91%
+        """,
+    }
+}
+
+
+_RAW_COMPETITOR_DATA = {
+    "AI software": {
+        "pricing": """
+            Competitor Pricing Analysis (AI Software):
+                Premium Tier Competitors:
+                - OpenAI GPT-4: $0.03-0.06 per 1K tokens, Enterprise: Custom pricing
+                - Google Vertex AI: $0.025-0.05 per 1K tokens
+                - Anthropic Claude: $0.008-0.024 per 1K tokens
+
+                Mid-Tier Competitors:
+                - Cohere: $0.015-0.035 per 1K tokens
+                - AI21 Labs: $0.01-0.03 per 1K tokens
+
+                Open Source Alternatives:
+                - Llama 2: Free (self-hosting costs apply)
+                - Mistral: Free/Premium hybrid model
+
+                Market Positioning:
+                - Premium segment: 15-20% price premium justified by performance
+                - Value segment: 30-40% lower pricing, trade-off on features
+                - Average enterprise deal: $50K-$500K annually""",
+        "features": """Competitor Feature Comparison:
+
+                OpenAI GPT-4:
+                + Best-in-class language understanding
+                + Multimodal capabilities (text + vision)
+                - Higher cost, API rate limits
+
+                Google Vertex AI:
+                + Strong integration with GCP
+                + Custom model training
+                - Complex setup, vendor lock-in
+
+                Anthropic Claude:
+                + Longest context window (100K tokens)
+                + Strong safety features
+                - Limited availability, newer platform
+
+                Market Gaps:
+                - Real-time processing
+                - Industry-specific fine-tuning
+                - Enhanced data privacy options
+            """,
+    }
+}
+
+
+_RAW_TREND_DATA = {
+    "AI adoption": {
+        "2024": """
+            AI Adoption Trends (2024):
+                Enterprise Adoption:
+                - 72% of Fortune 500 companies now use AI in production
+                - Average of 3.8 AI use cases per organization (up from 2.1 in 2023)
+                - Top use cases: Customer service automation (62%), Data analytics (58%), Process automation (54%)
+
+                Technology Trends:
+                - Generative AI dominates: 89% of AI projects involve GenAI
+                - Multi-modal AI growing 156% year-over-year
+                - Edge AI deployment increased 43%
+                - Responsible AI frameworks adopted by 67% of enterprises
+
+                Investment Trends:
+                - Corporate AI spending: $154 billion (34% increase)
+                - Focus shifting from experimentation to production deployment
+                - ROI expectations: 82% expect positive ROI within 12 months
+
+                Challenges:
+                - Talent shortage: 71% cite lack of AI expertise
+                - Data quality issues: 58% struggle with data preparation
+                - Integration complexity: 49% face legacy system challenges
+
+                Future Outlook:
+                - Predicted market size: $190 billion by end of 2025
+                - Expected annual growth: 35-40% through 2027
+                - Regulatory frameworks emerging in EU, US, and Asia
+            """,
+    }
+}
+
+# Datasets are shared by every cached tool call, so expose them read-only.
+# Dedenting once here also keeps indentation out of the agent's context.
+MARKET_DATA = freeze(_RAW_MARKET_DATA)
+FEEDBACK_DATA = freeze(_RAW_FEEDBACK_DATA)
+COMPETITOR_DATA = freeze(_RAW_COMPETITOR_DATA)
+TREND_DATA = freeze(_RAW_TREND_DATA)
+
+
 # =============================================================================
 # Market Analysis Tools
 # =============================================================================
 
 
 @tool
+@functools.lru_cache(maxsize=256)
 def get_market_data(product: str, region: str = "global") -> str:
     """Get comprehensive market analysis for a product in a specific region.
 
@@ -124,31 +282,11 @@ def get_market_data(product: str, region: str = "global") -> str:
     Returns:
         Formatted string containing comprehensive market analysis with metrics.
     """
-    market_data = {
-        "AI software": {
-            "global": """
-                Market Analysis for AI Software (Global):
-                - Market Size: $142.3 billion (2023)
-                - Growth Rate: 37.3% CAGR (2023-2030)
-                - Key Segments: Machine Learning (45%), NLP (28%), Computer Vision (27%)
-                - Top Players: OpenAI, Google, Microsoft, Anthropic
-                - Adoption Rate: 35% of enterprises have implemented AI solutions
-                - Investment: $93.5 billion in VC funding (2023)""",
-            "north america": """
-                Market Analysis for AI Software (North America):
-                - Market Size: $51.2 billion (2023)
-                - Growth Rate: 35.8% CAGR
-                - Leading Adopters: Technology (68%), Finance (52%), Healthcare (43%)
-                - Key Drivers: Digital transformation, automation, cost reduction
-            """,
-        }
-    }
-    return market_data.get(product, {}).get(
-        region, f"No data for {product} in {region}"
-    )
+    return MARKET_DATA.get((product, region), f"No data for {product} in {region}")
 
 
 @tool
+@functools.lru_cache(maxsize=256)
 def get_customer_feedback(product: str, timeframe: str = "last quarter") -> str:
     """Retrieve customer feedback, reviews, and comprehensive sentiment analysis.
 
@@ -167,35 +305,11 @@ def get_customer_feedback(product: str, timeframe: str = "last quarter") -> str:
         Formatted string containing detailed feedback analysis including NPS,
         satisfaction scores, and sentiment themes.
     """
-    feedback_data = {
-        "AI software": {
-            "last quarter": """
-                Customer Feedback Analysis (Q4 2024):
-                Positive Feedback (78%):
-                - "Significantly improved productivity by 40%"
-                - "Easy integration with existing workflows"
-                - "Excellent accuracy in predictions"
-                - "Strong customer support and documentation"
-                - "Cost-effective compared to hiring additional staff"
-
-                Negative Feedback (22%):
-                - "Initial setup complexity"
-                - "Requires training for optimal use"
-                - "Some features have steep learning curve"
-                - "Occasional latency issues during peak hours"
-
-                Key Insights:
-                - Net Promoter Score (NPS): 67 (Excellent)
-                - Customer Satisfaction: 4.3/5.0
-                - Feature Requests: Better mobile support, more customization options
-                - Retention Rate: 91%
-            """,
-        }
-    }
-    return feedback_data.get(product, {}).get(timeframe, f"No feedback for {product}")
+    return FEEDBACK_DATA.get((product, timeframe), f"No feedback for {product}")
 
 
 @tool
+@functools.lru_cache(maxsize=256)
 def get_competitor_analysis(industry: str, focus: str = "pricing") -> str:
     """Analyze the competitive landscape with detailed competitor intelligence.
 
@@ -215,55 +329,11 @@ def get_competitor_analysis(industry: str, focus: str = "pricing") -> str:
         Formatted string containing detailed competitive analysis with pricing,
         features, and market positioning insights.
     """
-    competitor_data = {
-        "AI software": {
-            "pricing": """
-                Competitor Pricing Analysis (AI Software):
-                    Premium Tier Competitors:
-                    - OpenAI GPT-4: $0.03-0.06 per 1K tokens, Enterprise: Custom pricing
-                    - Google Vertex AI: $0.025-0.05 per 1K tokens
-                    - Anthropic Claude: $0.008-0.024 per 1K tokens
-
-                    Mid-Tier Competitors:
-                    - Cohere: $0.015-0.035 per 1K tokens
-                    - AI21 Labs: $0.01-0.03 per 1K tokens
-
-                    Open Source Alternatives:
-                    - Llama 2: Free (self-hosting costs apply)
-                    - Mistral: Free/Premium hybrid model
-
-                    Market Positioning:
-                    - Premium segment: 15-20% price premium justified by performance
-                    - Value segment: 30-40% lower pricing, trade-off on features
-                    - Average enterprise deal: $50K-$500K annually""",
-            "features": """Competitor Feature Comparison:
-
-                    OpenAI GPT-4:
-                    + Best-in-class language understanding
-                    + Multimodal capabilities (text + vision)
-                    - Higher cost, API rate limits
-
-                    Google Vertex AI:
-                    + Strong integration with GCP
-                    + Custom model training
-                    - Complex setup, vendor lock-in
-
-                    Anthropic Claude:
-                    + Longest context window (100K tokens)
-                    + Strong safety features
-                    - Limited availability, newer platform
-
-                    Market Gaps:
-                    - Real-time processing
-                    - Industry-specific fine-tuning
-                    - Enhanced data privacy options
-                """,
-        }
-    }
-    return competitor_data.get(industry, {}).get(focus, f"No analysis for {industry}")
+    return COMPETITOR_DATA.get((industry, focus), f"No analysis for {industry}")
 
 
 @tool
+@functools.lru_cache(maxsize=256)
 def get_trend_analysis(topic: str, period: str = "2024") -> str:
     """Analyze industry trends, forecasts, and emerging patterns.
 
@@ -284,72 +354,38 @@ def get_trend_analysis(topic: str, period: str = "2024") -> str:
         Formatted string containing comprehensive trend analysis with adoption
         statistics, technology trends, investment patterns, and future outlook.
     """
-    trend_data = {
-        "AI adoption": {
-            "2024": """
-                AI Adoption Trends (2024):
-                    Enterprise Adoption:
-                    - 72% of Fortune 500 companies now use AI in production
-                    - Average of 3.8 AI use cases per organization (up from 2.1 in 2023)
-                    - Top use cases: Customer service automation (62%), Data analytics (58%), Process automation (54%)
-
-                    Technology Trends:
-                    - Generative AI dominates: 89% of AI projects involve GenAI
-                    - Multi-modal AI growing 156% year-over-year
-                    - Edge AI deployment increased 43%
-                    - Responsible AI frameworks adopted by 67% of enterprises
-
-                    Investment Trends:
-                    - Corporate AI spending: $154 billion (34% increase)
-                    - Focus shifting from experimentation to production deployment
-                    - ROI expectations: 82% expect positive ROI within 12 months
-
-                    Challenges:
-                    - Talent shortage: 71% cite lack of AI expertise
-                    - Data quality issues: 58% struggle with data preparation
-                    - Integration complexity: 49% face legacy system challenges
-
-                    Future Outlook:
-                    - Predicted market size: $190 billion by end of 2025
-                    - Expected annual growth: 35-40% through 2027
-                    - Regulatory frameworks emerging in EU, US, and Asia
-                """,
-        }
-    }
-    return trend_data.get(topic, {}).get(period, f"No trends for {topic}")
+    return TREND_DATA.get((topic, period), f"No trends for {topic}")
 
 
 # =============================================================================
 # Example Scenarios
 # =============================================================================
 
+SYSTEM_PROMPT = "Act as a business analyst."
 
-@timed
-async def simple_agent_example() -> None:
-    """Simple agent example: Database search, report generation, and email."""
-    tools = [search_database, generate_report, send_email]
-
-    system_prompt = """
-    Act as a business analyst.
-    """
-    prompt = """
+SIMPLE_PROMPT = inspect.cleandoc("""
     Find the top 5 revenue users, create a text report, and email it to
     team@example.com with subject "Revenue Report"
-    """
+    """)
 
-    async with Shadai(
-        name="test",
-        llm_model=LLMModel.GOOGLE_GEMINI_2_0_FLASH,
-        embedding_model=EmbeddingModel.GOOGLE_GEMINI_EMBEDDING_001,
-        system_prompt=system_prompt,
-    ) as shadai:
-        async for chunk in shadai.agent(prompt=prompt, tools=tools):
-            print(chunk, end="", flush=True)
-        print("\n")
+MARKET_PROMPT = inspect.cleandoc("""
+    I need a comprehensive market analysis for AI software. Include the current
+    market size and growth, what customers are saying, how we compare to competitors
+    in terms of pricing, and what the adoption trends look like. Give me actionable
+    insights for strategy planning.
+    """)
 
 
-@timed
-async def market_analysis_example() -> None:
+async def simple_agent_example(shadai: Shadai) -> AsyncIterator[str]:
+    """Simple agent example: Database search, report generation, and email."""
+    tools = [search_database, generate_report, send_email]
+
+    async for chunk in shadai.agent(prompt=SIMPLE_PROMPT, tools=tools):
+        yield chunk
+    yield "\n\n"
+
+
+async def market_analysis_example(shadai: Shadai) -> AsyncIterator[str]:
     """Complex agent example: Comprehensive market analysis."""
     tools = [
         get_market_data,
@@ -358,33 +394,32 @@ async def market_analysis_example() -> None:
         get_trend_analysis,
     ]
 
-    system_prompt = """
-    Act as a business analyst.
-    """
+    # The data sources are independent, so the agent can query them concurrently
+    async for chunk in shadai.agent(
+        prompt=MARKET_PROMPT, tools=tools, parallel_tools=True
+    ):
+        yield chunk
+    yield "\n\n"
 
-    prompt = """
-    I need a comprehensive market analysis for AI software. Include the current
-    market size and growth, what customers are saying, how we compare to competitors
-    in terms of pricing, and what the adoption trends look like. Give me actionable
-    insights for strategy planning.
-    """
 
+@timed
+async def main() -> None:
+    """Run all agent examples concurrently on a shared session."""
     async with Shadai(
         name="test",
         llm_model=LLMModel.GOOGLE_GEMINI_2_0_FLASH,
         embedding_model=EmbeddingModel.GOOGLE_GEMINI_EMBEDDING_001,
-        system_prompt=system_prompt,
+        system_prompt=SYSTEM_PROMPT,
     ) as shadai:
-        async for chunk in shadai.agent(prompt=prompt, tools=tools):
+        # Scenarios run concurrently; their output is shown in order
+        async for chunk in batched_stream(
+            gather_streams(
+                simple_agent_example(shadai),
+                market_analysis_example(shadai),
+            )
+        ):
             print(chunk, end="", flush=True)
-        print("\n")
-
-
-async def main() -> None:
-    """Run all agent examples."""
-    await simple_agent_example()
-    await market_analysis_example()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -0,0 +1,36 @@
+"""
+Example Bootstrap
+-----------------
+Shared setup for running the examples: makes the repository's shadai
+package importable and provides the example paths and the run() entry point.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any, Coroutine
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+DATA_DIR = ROOT_DIR / "examples" / "data"
+
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run an example's main coroutine, on uvloop when it is installed.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        Result of the coroutine
+    """
+    if uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
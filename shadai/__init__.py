@@ -46,8 +46,10 @@ GitHub: https://github.com/shadai/shadai-client
 """
 
 from .__version__ import __author__, __description__, __version__
+from .cache import ResponseCache
 from .client import ShadaiClient
 from .error_handler import install_exception_handler
+from .event_loop import install_uvloop, install_uvloop_from_env
 from .exceptions import (
     # Connection & Auth
     AuthenticationError,
@@ -115,6 +117,9 @@ __all__ = [
     "AgentTool",
     # Tool utilities
     "tool",
+    "ResponseCache",
+    # Event loop
+    "install_uvloop",
     # Models
     "Tool",
     "ToolDefinition",
@@ -162,3 +167,6 @@ __all__ = [
 
 # Install custom exception handler for clean error messages
 install_exception_handler()
+
+# Opt-in: run new event loops on uvloop (SHADAI_UVLOOP=1)
+install_uvloop_from_env()
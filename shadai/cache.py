@@ -0,0 +1,168 @@
+"""
+Response Cache
+--------------
+In-memory LRU cache for streamed tool responses.
+"""
+
+import contextlib
+import json
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "speedups" extra
+    orjson = None
+
+
+class ResponseCache:
+    """
+    LRU cache of streamed responses, keyed by tool name and arguments.
+
+    Entries are tracked per session so they can be dropped when the
+    documents of that session change (e.g. after an ingest).
+
+    Examples:
+        >>> cache = ResponseCache(maxsize=64)
+        >>> key = ResponseCache.make_key("shadai_query", arguments)
+        >>> async for chunk in cache.stream(key, session_uuid, stream):
+        ...     print(chunk, end="", flush=True)
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Initialize response cache.
+
+        Args:
+            maxsize: Maximum number of responses to keep
+
+        Raises:
+            ValueError: If maxsize is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[str, Tuple[str, ...]]]" = OrderedDict()
+        # Bumped on invalidate()/clear() so streams started before then are
+        # not stored afterwards
+        self._generations: Dict[str, int] = {}
+        self._clears = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(tool_name: str, arguments: Dict[str, Any]) -> str:
+        """
+        Build a cache key from a tool call.
+
+        Args:
+            tool_name: Name of the tool
+            arguments: Tool arguments as dictionary
+
+        Returns:
+            Canonical string key for the call
+        """
+        if orjson is not None:
+            encoded = orjson.dumps(
+                arguments,
+                default=str,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            ).decode("utf-8")
+        else:
+            encoded = json.dumps(arguments, sort_keys=True, default=str)
+        return f"{tool_name}:{encoded}"
+
+    def _generation(self, session_uuid: str) -> Tuple[int, int]:
+        return self._clears, self._generations.get(session_uuid, 0)
+
+    def get(self, key: str) -> Optional[Tuple[str, ...]]:
+        """
+        Get the cached chunks for a key.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Tuple of response chunks, or None if not cached
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: str, session_uuid: str, chunks: Tuple[str, ...]) -> None:
+        """
+        Store response chunks, evicting the least recently used entries.
+
+        Args:
+            key: Cache key from make_key()
+            session_uuid: Session the response belongs to
+            chunks: Response chunks in the order they were streamed
+        """
+        self._entries[key] = (session_uuid, chunks)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, session_uuid: str) -> None:
+        """
+        Drop all cached responses of a session.
+
+        Args:
+            session_uuid: Session UUID whose responses are stale
+        """
+        stale = [
+            key
+            for key, (entry_session, _) in self._entries.items()
+            if entry_session == session_uuid
+        ]
+        for key in stale:
+            del self._entries[key]
+        self._generations[session_uuid] = self._generations.get(session_uuid, 0) + 1
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+        self._clears += 1
+
+    async def stream(
+        self,
+        key: str,
+        session_uuid: str,
+        stream: AsyncIterator[str],
+    ) -> AsyncIterator[str]:
+        """
+        Replay a cached response or stream and record a fresh one.
+
+        The response is only stored once the stream completes, so partial
+        or failed responses are never cached. Neither are responses whose
+        session was invalidated while they were streaming.
+
+        Args:
+            key: Cache key from make_key()
+            session_uuid: Session the response belongs to
+            stream: Unstarted stream to consume on a cache miss
+
+        Yields:
+            Response chunks
+        """
+        cached = self.get(key)
+        if cached is not None:
+            for chunk in cached:
+                yield chunk
+            return
+
+        generation = self._generation(session_uuid)
+        chunks = []
+        async with contextlib.aclosing(stream) as source:
+            async for chunk in source:
+                chunks.append(chunk)
+                yield chunk
+
+        if self._generation(session_uuid) == generation:
+            self.set(key, session_uuid, tuple(chunks))
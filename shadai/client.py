@@ -4,14 +4,23 @@ Shadai Client - Base MCP Client
 Low-level client for communicating with Shadai MCP servers.
 """
 
+import asyncio
+import contextlib
 import json
 import logging
 import os
-from typing import Any, AsyncIterator, Dict, Optional
+import random
+import weakref
+from typing import Any, AsyncContextManager, AsyncIterator, Dict, List, Optional, Union
 
 import aiohttp
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "speedups" extra
+    orjson = None
+
 from .exceptions import (
     AuthenticationError,
     ConnectionError,
@@ -19,10 +28,118 @@ from .exceptions import (
     create_exception_from_error_response,
 )
 
-load_dotenv()
-
 logger = logging.getLogger(__name__)
 
+# Whether a .env file has been read into the environment yet
+_dotenv_loaded = False
+
+
+def _env_api_key() -> Optional[str]:
+    """Return SHADAI_API_KEY from the environment.
+
+    A .env file is only read if the variable is not already set, and at most
+    once per process, so importing shadai does no filesystem lookups.
+    """
+    global _dotenv_loaded
+    if "SHADAI_API_KEY" not in os.environ and not _dotenv_loaded:
+        _dotenv_loaded = True
+        load_dotenv()
+    return os.getenv("SHADAI_API_KEY")
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON with orjson when installed, else the standard library.
+
+    Both raise a json.JSONDecodeError subclass on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON with orjson when installed, else the standard library."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode("utf-8")
+
+
+# Seconds an idle pooled connection is kept open. Longer than aiohttp's 15s
+# default so connections survive the pauses between agent steps.
+_KEEPALIVE_TIMEOUT = 30
+
+# Seconds a resolved host address is reused before it is looked up again
+_DNS_CACHE_TTL = 300
+
+# HTTP sessions shared by every client running on the same event loop, with
+# the number of clients using each one. Entries go away with their loop.
+_shared_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _new_session() -> aiohttp.ClientSession:
+    """Create an HTTP session with the client's connection pool settings."""
+    connector = aiohttp.TCPConnector(
+        keepalive_timeout=_KEEPALIVE_TIMEOUT, ttl_dns_cache=_DNS_CACHE_TTL
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def _acquire_session(loop: asyncio.AbstractEventLoop) -> aiohttp.ClientSession:
+    """Get the HTTP session shared on a loop, creating it if needed."""
+    entry = _shared_sessions.get(loop)
+    if entry is None or entry[0].closed:
+        entry = _shared_sessions[loop] = [_new_session(), 0]
+    entry[1] += 1
+    return entry[0]
+
+
+def _release_session(
+    loop: asyncio.AbstractEventLoop, session: aiohttp.ClientSession
+) -> bool:
+    """Stop using a shared HTTP session.
+
+    Returns:
+        True if this was its last user and the session should be closed
+    """
+    entry = _shared_sessions.get(loop)
+    if entry is None or entry[0] is not session:
+        # Already replaced after being closed elsewhere
+        return False
+
+    entry[1] -= 1
+    if entry[1] > 0:
+        return False
+
+    del _shared_sessions[loop]
+    return True
+
+
+def _discard_session(session: aiohttp.ClientSession) -> None:
+    """Close a shared HTTP session whose event loop is no longer in use.
+
+    session.close() cannot be awaited from another loop, so the connector is
+    closed synchronously instead. That relies on a private aiohttp method;
+    without it the session is logged and left to the garbage collector.
+    Sockets of a loop that was already closed (e.g. by asyncio.run()) can no
+    longer be shut down and are released when collected.
+    """
+    connector = session.connector
+    if connector is None or connector.closed:
+        return
+
+    close = getattr(connector, "_close", None)
+    if close is not None:
+        close()
+    else:
+        logger.warning("Could not close the HTTP session of a previous event loop")
+
+
+def _rpc_envelope(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a JSON-RPC 2.0 request."""
+    return {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
+
 
 class ShadaiClient:
     """
@@ -31,10 +148,13 @@ class ShadaiClient:
     This is the low-level client that handles JSON-RPC communication
     and NDJSON streaming with automatic heartbeat handling.
 
+    Inside ``async with`` the client reuses pooled connections; calls made
+    outside a context open and close a connection of their own.
+
     Examples:
-        >>> client = ShadaiClient(api_key="your-api-key")
-        >>> health = await client.health_check()
-        >>> print(health)
+        >>> async with ShadaiClient(api_key="your-api-key") as client:
+        ...     health = await client.health_check()
+        ...     print(health)
     """
 
     def __init__(
@@ -42,6 +162,10 @@ class ShadaiClient:
         api_key: Optional[str] = None,
         base_url: str = "http://localhost",
         timeout: int = 30,
+        connect_timeout: float = 10,
+        read_timeout: float = 30,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
     ) -> None:
         """
         Initialize Shadai client.
@@ -49,31 +173,270 @@ class ShadaiClient:
         Args:
             api_key: Your Shadai API key (required)
             base_url: Base URL of the Shadai server
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds (streams have no total limit)
+            connect_timeout: Timeout in seconds for establishing a connection
+            read_timeout: Maximum seconds without data on a stream
+            max_retries: Times to retry a request whose connection could not
+                be established (default: 2)
+            retry_backoff: Delay in seconds before the first retry, doubled
+                after each attempt (default: 0.5)
 
         Raises:
-            ValueError: If api_key is not provided
+            ValueError: If api_key is not provided or max_retries is negative
         """
         if not api_key:
-            api_key = os.getenv("SHADAI_API_KEY")
+            api_key = _env_api_key()
             if not api_key:
                 raise ValueError("API key is required")
+        if max_retries < 0:
+            raise ValueError("max_retries must be zero or greater")
 
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
-        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        # Streams can run for minutes; only guard connecting and stalls
+        self.stream_timeout = aiohttp.ClientTimeout(
+            total=None, connect=connect_timeout, sock_read=read_timeout
+        )
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
 
         self.rpc_url = f"{self.base_url}/mcp/rpc"
         self.stream_url = f"{self.base_url}/mcp/stream"
         self.health_url = f"{self.base_url}/mcp/health"
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get HTTP headers for requests."""
-        return {
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._contexts = 0
+
+    @property
+    def api_key(self) -> str:
+        """API key sent with every request."""
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: str) -> None:
+        # Headers are built once per key and shared by every request
+        self._api_key = api_key
+        self._headers = {
             "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
+            "Authorization": f"Bearer {api_key}",
         }
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session, joining the shared one on first use.
+
+        All clients on the same event loop share one session and connection
+        pool, so keep-alive connections opened by any client (or any Shadai
+        instance) skip the TCP/TLS handshake for the others. The session is
+        joined again if the previous one was closed or belongs to another
+        event loop.
+
+        Returns:
+            Shared aiohttp client session
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            if self._session is not None and _release_session(
+                self._session_loop, self._session
+            ):
+                # Last user of a session from another loop, which can't be awaited
+                _discard_session(self._session)
+            self._session = _acquire_session(loop)
+            self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """
+        Release the HTTP session.
+
+        The shared session and its pooled connections are closed once the
+        last client using them is closed. The client can still be used
+        afterwards; inside a context it joins a session again on the next
+        request.
+
+        Examples:
+            >>> await client.close()
+        """
+        session, self._session = self._session, None
+        loop, self._session_loop = self._session_loop, None
+        if session is None:
+            return
+
+        if not _release_session(loop, session) or session.closed:
+            return
+        if loop is asyncio.get_running_loop():
+            await session.close()
+        else:
+            _discard_session(session)
+
+    async def __aenter__(self) -> "ShadaiClient":
+        """Enter context: requests share pooled connections until it exits."""
+        self._contexts += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit context: release the HTTP session once the last context exits."""
+        self._contexts = max(self._contexts - 1, 0)
+        if self._contexts == 0:
+            await self.close()
+
+    @contextlib.asynccontextmanager
+    async def _request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Send a request and release the response when done.
+
+        Inside a context the shared session is used. Outside one, the request
+        gets its own session, closed with the response, so no connection
+        outlives the call.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Extra arguments for aiohttp's request()
+
+        Yields:
+            Response
+
+        Raises:
+            aiohttp.ClientConnectorError: If every attempt fails to connect
+        """
+        if self._contexts:
+            async with await self._send(
+                self._get_session(), method, url, **kwargs
+            ) as response:
+                yield response
+            return
+
+        async with _new_session() as session:
+            async with await self._send(session, method, url, **kwargs) as response:
+                yield response
+
+    async def _send(
+        self, session: aiohttp.ClientSession, method: str, url: str, **kwargs: Any
+    ) -> aiohttp.ClientResponse:
+        """
+        Send a request, retrying when the connection cannot be established.
+
+        Only connection failures are retried: the request was never sent, so
+        retrying is safe even for non-idempotent tool calls. Delays grow
+        exponentially with +/-10% jitter.
+
+        Args:
+            session: HTTP session to send the request with
+            method: HTTP method
+            url: Request URL
+            **kwargs: Extra arguments for aiohttp's request()
+
+        Returns:
+            Response, to be used as an async context manager
+
+        Raises:
+            aiohttp.ClientConnectorError: If every attempt fails to connect
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await session.request(method, url, **kwargs)
+            except aiohttp.ClientConnectorError as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.retry_backoff * 2**attempt * random.uniform(0.9, 1.1)
+                logger.debug(f"Connection failed ({e}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+        raise AssertionError("unreachable: the last attempt returns or raises")
+
+    def _post(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        timeout: aiohttp.ClientTimeout,
+    ) -> AsyncContextManager[aiohttp.ClientResponse]:
+        """
+        POST a JSON payload to the server.
+
+        Args:
+            url: Endpoint URL
+            payload: JSON-serializable request body
+            timeout: Request timeout
+
+        Returns:
+            Async context manager yielding the response
+        """
+        return self._request(
+            "POST",
+            url,
+            data=_json_dumps(payload),
+            headers=self._headers,
+            timeout=timeout,
+        )
+
+    @staticmethod
+    def _check_status(response: aiohttp.ClientResponse) -> None:
+        """
+        Raise for unsuccessful HTTP responses.
+
+        Raises:
+            AuthenticationError: If the API key was rejected
+            aiohttp.ClientResponseError: For any other error status
+        """
+        if response.status == 401:
+            raise AuthenticationError("Invalid API key")
+        response.raise_for_status()
+
+    @staticmethod
+    async def _read_json(response: aiohttp.ClientResponse) -> Any:
+        """
+        Read and decode a JSON response body.
+
+        The raw bytes are handed straight to the JSON parser, skipping the
+        text decoding step of aiohttp's response.json().
+
+        Raises:
+            ServerError: If the body is not valid JSON
+        """
+        body = await response.read()
+        try:
+            return _json_loads(body)
+        except ValueError as e:
+            raise ServerError(
+                message=f"Invalid JSON response: {e}", status_code=response.status
+            ) from e
+
+    @staticmethod
+    def _raise_for_rpc_error(data: Dict[str, Any]) -> None:
+        """
+        Raise if a JSON-RPC response reports an error.
+
+        Args:
+            data: Decoded JSON-RPC response
+
+        Raises:
+            ServerError: If the response has a JSON-RPC error
+            ShadaiError: If the result is a standardized error response
+        """
+        # Check for JSON-RPC error format
+        if "error" in data:
+            error = data["error"]
+            code = error.get("code")
+            raise ServerError(
+                message=f"{error.get('message', 'Unknown error')} (code: {code})",
+                rpc_error_code=code,
+            )
+
+        # Check for standardized error response format
+        result = data.get("result", {})
+        if isinstance(result, dict) and result.get("success") is False:
+            error_data = result.get("error", {})
+            exception = create_exception_from_error_response(error_data=error_data)
+            raise exception
+
     async def health_check(self) -> Dict[str, Any]:
         """
         Check server health and availability.
@@ -91,12 +454,11 @@ class ShadaiClient:
             >>> print(f"Tools: {health['tools']}")
         """
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.get(url=self.health_url) as response:
-                    if response.status == 401:
-                        raise AuthenticationError("Invalid API key")
-                    response.raise_for_status()
-                    return await response.json()
+            async with self._request(
+                "GET", self.health_url, timeout=self.timeout
+            ) as response:
+                self._check_status(response)
+                return await self._read_json(response)
         except aiohttp.ClientError as e:
             raise ConnectionError(f"Failed to connect to server: {e}") from e
 
@@ -167,43 +529,17 @@ class ShadaiClient:
             ServerError: If server returns an error
             ConnectionError: If connection fails
         """
-        request = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params or {},
-            "id": 1,
-        }
+        request = _rpc_envelope(method=method, params=params or {})
 
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.post(
-                    url=self.rpc_url,
-                    json=request,
-                    headers=self._get_headers(),
-                ) as response:
-                    if response.status == 401:
-                        raise AuthenticationError("Invalid API key")
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    # Check for JSON-RPC error format
-                    if "error" in data:
-                        error = data["error"]
-                        raise ServerError(
-                            message=f"{error.get('message', 'Unknown error')} "
-                            f"(code: {error.get('code')})"
-                        )
-
-                    # Check for standardized error response format
-                    result = data.get("result", {})
-                    if isinstance(result, dict) and result.get("success") is False:
-                        error_data = result.get("error", {})
-                        exception = create_exception_from_error_response(
-                            error_data=error_data
-                        )
-                        raise exception
-
-                    return data
+            async with self._post(
+                self.rpc_url, payload=request, timeout=self.timeout
+            ) as response:
+                self._check_status(response)
+                data = await self._read_json(response)
+
+            self._raise_for_rpc_error(data)
+            return data
         except aiohttp.ClientError as e:
             raise ConnectionError(f"Request failed: {e}") from e
 
@@ -232,47 +568,100 @@ class ShadaiClient:
             ... )
             >>> # Returns: '{"uuid": "123", "name": "my-session", ...}'
         """
-        response = await self.call_rpc(
-            method="tools/call",
-            params={
-                "name": tool_name,
-                "arguments": arguments,
-            },
+        text_response = await self._call_tool_text(
+            tool_name=tool_name, arguments=arguments
         )
-
-        content = response.get("result", {}).get("content", [])
-        if not content:
-            return ""
-
-        text_response = content[0].get("text", "")
         if not text_response:
             return ""
 
         # Parse the response to check if it's a standardized format
         try:
-            parsed = json.loads(text_response)
-
-            # Check if it's a standardized response with success field
-            if isinstance(parsed, dict) and "success" in parsed:
-                if parsed.get("success") is False:
-                    # Error response - create and raise exception
-                    error_data = parsed.get("error", {})
-                    exception = create_exception_from_error_response(
-                        error_data=error_data
-                    )
-                    raise exception
-
-                # Success response - unwrap and return just the data
-                if parsed.get("success") is True:
-                    data = parsed.get("data", {})
-                    return json.dumps(data)
+            parsed = _json_loads(text_response)
+        except json.JSONDecodeError:
+            # Not JSON - return as is
+            return text_response
 
+        data = self._unwrap_tool_data(parsed)
+        if data is parsed:
             # Not a standardized format - return as is
             return text_response
+        return _json_dumps(data).decode("utf-8")
 
-        except json.JSONDecodeError:
-            # Not JSON - return as is
-            return text_response
+    async def call_tool_json(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+    ) -> Any:
+        """
+        Call a tool and get its parsed JSON response (non-streaming).
+
+        Same as call_tool() but returns the decoded data, so callers that
+        need Python objects skip re-serializing and re-parsing it.
+
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Tool arguments as dictionary
+
+        Returns:
+            Decoded tool response (unwrapped from standardized format)
+
+        Raises:
+            ShadaiError: If tool returns error response
+            json.JSONDecodeError: If the response is not JSON
+
+        Examples:
+            >>> session = await client.call_tool_json(
+            ...     tool_name="session_create",
+            ...     arguments={"name": "my-session"}
+            ... )
+            >>> print(session["uuid"])
+        """
+        text_response = await self._call_tool_text(
+            tool_name=tool_name, arguments=arguments
+        )
+        return self._unwrap_tool_data(_json_loads(text_response))
+
+    async def _call_tool_text(self, tool_name: str, arguments: Dict[str, Any]) -> str:
+        """Call a tool and return the text of its first content item."""
+        response = await self.call_rpc(
+            method="tools/call",
+            params={"name": tool_name, "arguments": arguments},
+        )
+
+        result = response.get("result")
+        content = result.get("content") if result else None
+        if not content:
+            return ""
+        return content[0].get("text") or ""
+
+    @staticmethod
+    def _unwrap_tool_data(parsed: Any) -> Any:
+        """
+        Unwrap a standardized {"success": ..., "data": ...} tool response.
+
+        Args:
+            parsed: Decoded tool response
+
+        Returns:
+            The data of a successful standardized response, otherwise parsed
+            itself
+
+        Raises:
+            ShadaiError: If the response reports an error
+        """
+        # Check if it's a standardized response with success field
+        if isinstance(parsed, dict) and "success" in parsed:
+            if parsed.get("success") is False:
+                # Error response - create and raise exception
+                error_data = parsed.get("error", {})
+                exception = create_exception_from_error_response(error_data=error_data)
+                raise exception
+
+            # Success response - unwrap and return just the data
+            if parsed.get("success") is True:
+                return parsed.get("data", {})
+
+        return parsed
 
     async def stream_tool(
         self,
@@ -298,55 +687,75 @@ class ShadaiClient:
             ... ):
             ...     print(chunk, end="", flush=True)
         """
-        request = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments,
-            },
-            "id": 1,
-        }
-
-        timeout = aiohttp.ClientTimeout(total=None, sock_read=30)
+        request = _rpc_envelope(
+            method="tools/call",
+            params={"name": tool_name, "arguments": arguments},
+        )
 
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    url=self.stream_url,
-                    json=request,
-                    headers=self._get_headers(),
-                ) as response:
-                    if response.status == 401:
-                        raise AuthenticationError("Invalid API key")
-                    response.raise_for_status()
-
-                    async for line in response.content:
-                        line_str = line.decode("utf-8").strip()
-
-                        if not line_str:
-                            continue
-
-                        try:
-                            data = json.loads(line_str)
-
-                            if data.get("method") == "notifications/heartbeat":
-                                timestamp = data.get("params", {}).get("timestamp")
-                                logger.debug(f"Heartbeat received: {timestamp}")
-                                continue
-
-                            if data.get("method") == "notifications/progress":
-                                chunk = data.get("params", {}).get("progress", "")
-                                if chunk:
-                                    yield chunk
-
-                        except json.JSONDecodeError:
-                            logger.warning(f"Failed to parse NDJSON line: {line_str}")
-                            continue
+            async with self._post(
+                self.stream_url, payload=request, timeout=self.stream_timeout
+            ) as response:
+                self._check_status(response)
+
+                # Split whatever bytes have arrived into lines ourselves
+                # rather than awaiting one readline() per message
+                buffer = bytearray()
+                async for data in response.content.iter_any():
+                    buffer += data
+                    end = buffer.rfind(b"\n")
+                    if end == -1:
+                        continue
+
+                    lines = bytes(buffer[:end]).split(b"\n")
+                    del buffer[: end + 1]
+                    for line in lines:
+                        chunk = self._parse_stream_line(line)
+                        if chunk:
+                            yield chunk
+
+                # The last message may not end with a newline
+                chunk = self._parse_stream_line(bytes(buffer))
+                if chunk:
+                    yield chunk
 
         except aiohttp.ClientError as e:
             raise ConnectionError(f"Streaming request failed: {e}") from e
 
+    @staticmethod
+    def _parse_stream_line(line: bytes) -> Optional[str]:
+        """
+        Parse one NDJSON line of a tool stream.
+
+        Args:
+            line: Raw line, without its newline
+
+        Returns:
+            Text chunk of a progress notification, or None for any other
+            line
+        """
+        # Only progress notifications carry text. Heartbeats, which can make
+        # up most of an idle stream, are skipped without being decoded.
+        if b"progress" not in line:
+            if b"heartbeat" in line and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Heartbeat received: {line.decode('utf-8', 'replace')}")
+            return None
+
+        line = line.strip()
+        try:
+            data = _json_loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            logger.warning(
+                "Failed to parse NDJSON line: "
+                f"{line.decode('utf-8', errors='replace')}"
+            )
+            return None
+
+        if data.get("method") == "notifications/progress":
+            return data.get("params", {}).get("progress", "") or None
+
+        return None
+
     async def get_session_history(
         self,
         session_uuid: str,
@@ -381,7 +790,7 @@ class ShadaiClient:
             >>> for msg in history['messages']:
             ...     print(f"[{msg['role']}]: {msg['content']}")
         """
-        result = await self.call_tool(
+        return await self.call_tool_json(
             tool_name="session_get_history",
             arguments={
                 "session_uuid": session_uuid,
@@ -389,7 +798,6 @@ class ShadaiClient:
                 "page_size": page_size,
             },
         )
-        return json.loads(result)
 
     async def clear_session_history(
         self,
@@ -411,8 +819,7 @@ class ShadaiClient:
             >>> result = await client.clear_session_history(session_uuid="abc-123")
             >>> print(result['message'])  # "Chat history cleared successfully"
         """
-        result = await self.call_tool(
+        return await self.call_tool_json(
             tool_name="session_clear_history",
             arguments={"session_uuid": session_uuid},
         )
-        return json.loads(result)
@@ -0,0 +1,44 @@
+"""
+Event Loop Utilities
+--------------------
+Opt-in uvloop support for faster socket I/O and task scheduling.
+"""
+
+import asyncio
+import os
+
+UVLOOP_ENV_VAR = "SHADAI_UVLOOP"
+
+
+def install_uvloop() -> bool:
+    """Make new asyncio event loops use uvloop when it is installed.
+
+    A loop policy set by the application is left untouched. Loops that are
+    already running keep their implementation.
+
+    Usage:
+        install_uvloop()
+        asyncio.run(main())
+
+    Returns:
+        True if uvloop's policy is in place, False otherwise
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    policy = asyncio.get_event_loop_policy()
+    if isinstance(policy, uvloop.EventLoopPolicy):
+        return True
+    if type(policy) is not asyncio.DefaultEventLoopPolicy:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def install_uvloop_from_env() -> None:
+    """Install uvloop if the SHADAI_UVLOOP environment variable is enabled."""
+    if os.getenv(UVLOOP_ENV_VAR, "").strip().lower() in ("1", "true", "yes"):
+        install_uvloop()
@@ -607,10 +607,17 @@ class TimeoutError(SystemError):
 class ServerError(SystemError):
     """Raised when server returns an unexpected error."""
 
-    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        rpc_error_code: Optional[int] = None,
+    ) -> None:
         context = {}
         if status_code:
             context["status_code"] = status_code
+        if rpc_error_code is not None:
+            context["rpc_error_code"] = rpc_error_code
 
         super().__init__(
             message=message,
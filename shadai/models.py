@@ -11,6 +11,9 @@ from typing import Any, Callable, Dict, Optional, Union
 from langchain_core.tools.base import create_schema_from_function
 from pydantic import BaseModel, Field
 
+# Docstring sections that are already part of the parameter schema
+_ARGS_SECTIONS = ("Args:", "Arguments:")
+
 
 class LLMModel(str, Enum):
     """Available LLM models with provider:model format."""
@@ -174,6 +177,8 @@ class AgentTool(BaseModel):
         implementation: Function that executes the tool
         arguments: Optional default arguments (planner infers from user prompt if not provided)
         parameters: JSON Schema defining tool parameters (used by planner to infer arguments)
+        run_in_thread: Run a sync implementation in a worker thread instead of
+            on the event loop's thread
     """
 
     name: str = Field(..., description="Unique tool identifier")
@@ -189,12 +194,33 @@ class AgentTool(BaseModel):
         default=None,
         description="JSON Schema for tool parameters (used for argument inference)",
     )
+    run_in_thread: bool = Field(
+        default=False,
+        description="Run a sync implementation in a worker thread (for blocking I/O)",
+    )
 
     class Config:
         """Pydantic config."""
 
         arbitrary_types_allowed = True
 
+    @property
+    def definition(self) -> Dict[str, Any]:
+        """
+        Tool definition sent to the agent planner.
+
+        Built from the current field values on every access, so edits and
+        model_copy() updates are always reflected.
+
+        Returns:
+            Dictionary with the tool name, description and parameter schema
+        """
+        return {
+            "name": self.name,
+            "description": self.description,
+            "parameters": self.parameters,
+        }
+
     @classmethod
     def create(
         cls,
@@ -203,6 +229,7 @@ class AgentTool(BaseModel):
         implementation: Callable[..., Any],
         arguments: Optional[Dict[str, Any]] = None,
         parameters: Optional[Dict[str, Any]] = None,
+        run_in_thread: bool = False,
     ) -> "AgentTool":
         """
         Create an AgentTool instance.
@@ -213,6 +240,7 @@ class AgentTool(BaseModel):
             implementation: Function that implements the tool
             arguments: Arguments to pass when executing
             parameters: Optional JSON Schema
+            run_in_thread: Run a sync implementation in a worker thread
 
         Returns:
             AgentTool instance
@@ -223,6 +251,7 @@ class AgentTool(BaseModel):
             implementation=implementation,
             arguments=arguments or {},
             parameters=parameters,
+            run_in_thread=run_in_thread,
         )
 
     @classmethod
@@ -233,6 +262,7 @@ class AgentTool(BaseModel):
         description: Optional[str] = None,
         arguments: Optional[Dict[str, Any]] = None,
         parse_docstring: bool = True,
+        run_in_thread: bool = False,
     ) -> "AgentTool":
         """
         Create an AgentTool from a function using automatic schema inference.
@@ -244,9 +274,11 @@ class AgentTool(BaseModel):
         Args:
             func: Function to convert to a tool
             name: Optional override for tool name (uses func.__name__ if not provided)
-            description: Optional override for description (uses docstring if not provided)
+            description: Optional override for description (uses docstring if not provided,
+                without its Args section when parse_docstring is set)
             arguments: Optional default arguments
             parse_docstring: Whether to parse Google-style docstrings for parameter descriptions
+            run_in_thread: Run a sync implementation in a worker thread
 
         Returns:
             AgentTool instance with auto-generated schema
@@ -267,6 +299,9 @@ class AgentTool(BaseModel):
         # Get function name and description
         tool_name = name or func.__name__
         tool_description = description or inspect.getdoc(func) or ""
+        if not description and parse_docstring:
+            # Parameter docs move into the schema, keep only the summary here
+            tool_description = _strip_args_section(tool_description)
 
         # Create Pydantic schema from function signature
         pydantic_schema = create_schema_from_function(
@@ -285,9 +320,37 @@ class AgentTool(BaseModel):
             implementation=func,
             arguments=arguments or {},
             parameters=json_schema,
+            run_in_thread=run_in_thread,
         )
 
 
+def _strip_args_section(docstring: str) -> str:
+    """
+    Remove the Args section from a Google-style docstring.
+
+    Other sections such as Returns or Raises are kept, since the parameter
+    schema does not describe them.
+
+    Args:
+        docstring: Cleaned function docstring
+
+    Returns:
+        Docstring without its Args/Arguments section
+    """
+    lines = []
+    in_args = False
+    for line in docstring.splitlines():
+        if line.strip() in _ARGS_SECTIONS and not line[:1].isspace():
+            in_args = True
+            continue
+        if in_args and (not line.strip() or line[:1].isspace()):
+            continue
+        in_args = False
+        if line.strip() or (lines and lines[-1].strip()):
+            lines.append(line)
+    return "\n".join(lines).strip()
+
+
 def tool(
     func: Optional[Callable[..., Any]] = None,
     *,
@@ -295,6 +358,7 @@ def tool(
     description: Optional[str] = None,
     arguments: Optional[Dict[str, Any]] = None,
     parse_docstring: bool = True,
+    run_in_thread: bool = False,
 ) -> Union[AgentTool, Callable[[Callable[..., Any]], AgentTool]]:
     """
     Decorator to convert a function into an AgentTool with automatic schema inference.
@@ -308,6 +372,8 @@ def tool(
         description: Optional override for description
         arguments: Optional default arguments to pass when executing
         parse_docstring: Whether to parse Google-style docstrings for parameter descriptions
+        run_in_thread: Run a sync implementation in a worker thread so blocking
+            I/O doesn't stall the event loop (default: False)
 
     Returns:
         AgentTool instance or decorator function
@@ -335,6 +401,12 @@ def tool(
         ... def search_database(query: str, limit: int = 10) -> str:
         ...     '''Search the database.'''
         ...     return "results"
+
+        Blocking sync tool run in a worker thread:
+        >>> @tool(run_in_thread=True)
+        ... def fetch_page(url: str) -> str:
+        ...     '''Download a web page.'''
+        ...     return urllib.request.urlopen(url).read().decode()
     """
 
     def decorator(f: Callable[..., Any]) -> AgentTool:
@@ -344,6 +416,7 @@ def tool(
             description=description,
             arguments=arguments,
             parse_docstring=parse_docstring,
+            run_in_thread=run_in_thread,
         )
 
     # If called without parentheses: @tool
@@ -4,14 +4,32 @@ Session Context Manager
 Context manager for managing RAG session lifecycle.
 """
 
-import json
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 from uuid import uuid4
 
 from .client import ShadaiClient
 from .models import EmbeddingModel, LLMModel
 
 
+def _split_model(model: Union[str, "LLMModel", "EmbeddingModel"]) -> Tuple[str, str]:
+    """Split a "provider:model" identifier into its provider and model name.
+
+    Args:
+        model: Model enum or "provider:model" string
+
+    Returns:
+        Tuple of (provider, model name)
+
+    Raises:
+        ValueError: If the identifier is not in "provider:model" format
+    """
+    value = model.value if hasattr(model, "value") else str(model)
+    provider, separator, model_name = value.partition(":")
+    if not separator or not provider or not model_name or ":" in model_name:
+        raise ValueError(f"Invalid model '{value}': expected 'provider:model'")
+    return provider, model_name
+
+
 class Session:
     """Internal context manager for RAG session lifecycle.
 
@@ -52,8 +70,19 @@ class Session:
         self._temporal = temporal
         self._client = client
         self._system_prompt = system_prompt
-        self._llm_model = llm_model
-        self._embedding_model = embedding_model
+
+        # Resolve model identifiers up front so invalid ones fail before any
+        # session is created
+        self._model_args: Dict[str, str] = {}
+        if llm_model:
+            provider, model_name = _split_model(llm_model)
+            self._model_args["llm_provider"] = provider
+            self._model_args["llm_model"] = model_name
+        if embedding_model:
+            provider, model_name = _split_model(embedding_model)
+            self._model_args["embedding_provider"] = provider
+            self._model_args["embedding_model"] = model_name
+
         self._session_data: Optional[dict] = None
 
     @property
@@ -75,71 +104,34 @@ class Session:
         Raises:
             Exception: If session creation/update fails
         """
-        # Step 1: Create or retrieve session
-        create_args = {}
-
+        # Step 1: Create or retrieve session. Named sessions are fetched if
+        # they already exist; unnamed ones are created with a generated name.
         if self._name:
-            # Get existing session or create if doesn't exist
-            create_args["name"] = self._name
-            if self._system_prompt:
-                create_args["system_prompt"] = self._system_prompt
-
-            result = await self._client.call_tool(
-                tool_name="session_get_or_create",
-                arguments=create_args,
-            )
-            self._session_data = json.loads(result)
+            tool_name = "session_get_or_create"
+            create_args = {"name": self._name}
         else:
-            # Create new session with generated name
-            generated_name = f"session-{uuid4().hex[:8]}"
-            create_args["name"] = generated_name
-            if self._system_prompt:
-                create_args["system_prompt"] = self._system_prompt
-
-            result = await self._client.call_tool(
-                tool_name="session_create",
-                arguments=create_args,
-            )
-            self._session_data = json.loads(result)
+            tool_name = "session_create"
+            create_args = {"name": f"session-{uuid4().hex[:8]}"}
+
+        if self._system_prompt:
+            create_args["system_prompt"] = self._system_prompt
+
+        self._session_data = await self._client.call_tool_json(
+            tool_name=tool_name,
+            arguments=create_args,
+        )
 
         # Step 2: Update models if provided
-        if self._llm_model or self._embedding_model:
+        if self._model_args:
             try:
-                update_args = {"session_uuid": self.uuid}
-
-                # Parse LLM model if provided
-                if self._llm_model:
-                    llm_value = (
-                        self._llm_model.value
-                        if hasattr(self._llm_model, "value")
-                        else str(self._llm_model)
-                    )
-                    llm_provider, llm_model_name = llm_value.split(":")
-                    update_args["llm_provider"] = llm_provider
-                    update_args["llm_model"] = llm_model_name
-
-                # Parse embedding model if provided
-                if self._embedding_model:
-                    embedding_value = (
-                        self._embedding_model.value
-                        if hasattr(self._embedding_model, "value")
-                        else str(self._embedding_model)
-                    )
-                    embedding_provider, embedding_model_name = embedding_value.split(
-                        ":"
-                    )
-                    update_args["embedding_provider"] = embedding_provider
-                    update_args["embedding_model"] = embedding_model_name
+                update_args = {"session_uuid": self.uuid, **self._model_args}
 
                 # Call session_update_models MCP tool
-                result = await self._client.call_tool(
+                response = await self._client.call_tool_json(
                     tool_name="session_update_models",
                     arguments=update_args,
                 )
 
-                # Parse response and update session data
-                response = json.loads(result)
-
                 # Check if response is in new format with success/data structure
                 if isinstance(response, dict) and "success" in response:
                     if not response["success"]:
@@ -0,0 +1,161 @@
+"""
+Streaming Utilities
+-------------------
+Helpers for consuming streamed responses efficiently.
+"""
+
+import asyncio
+import contextlib
+from typing import AsyncIterator, List, Optional
+
+_END = object()
+
+
+async def _aclose(stream: AsyncIterator[str]) -> None:
+    """Close a stream that supports it (e.g. an async generator)."""
+    aclose = getattr(stream, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+async def batched_stream(
+    stream: AsyncIterator[str],
+    max_interval: float = 0.03,
+    max_chars: int = 4096,
+) -> AsyncIterator[str]:
+    """Coalesce small streamed chunks into larger ones.
+
+    Token-sized chunks are buffered and emitted together once the first
+    buffered chunk is max_interval seconds old or max_chars characters have
+    accumulated, so consumers write to the terminal a few dozen times per
+    second instead of once per token.
+
+    Usage:
+        async for chunk in batched_stream(shadai.query(...)):
+            print(chunk, end="", flush=True)
+
+    Args:
+        stream: Stream of text chunks
+        max_interval: Maximum seconds to hold buffered text
+        max_chars: Maximum characters to buffer before emitting
+
+    Yields:
+        Text chunks combining one or more chunks of the source stream
+    """
+    queue: "asyncio.Queue[object]" = asyncio.Queue()
+
+    async def pump() -> None:
+        try:
+            async for chunk in stream:
+                queue.put_nowait(chunk)
+        finally:
+            # Release the source's resources (e.g. its HTTP response) right
+            # away, also when the consumer stops early
+            await _aclose(stream)
+            queue.put_nowait(_END)
+
+    # Read the source in its own task so a pending read is never cancelled
+    # when the flush interval expires
+    reader = asyncio.create_task(pump())
+    loop = asyncio.get_running_loop()
+    buffer: List[str] = []
+    buffered_chars = 0
+    deadline = 0.0
+
+    try:
+        while True:
+            timeout = deadline - loop.time() if buffer else None
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+                continue
+
+            if item is _END:
+                break
+
+            chunk = str(item)
+            if not buffer:
+                deadline = loop.time() + max_interval
+            buffer.append(chunk)
+            buffered_chars += len(chunk)
+
+            if buffered_chars >= max_chars:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+
+        if buffer:
+            yield "".join(buffer)
+
+        # Re-raise any error from the source stream
+        await reader
+    finally:
+        if not reader.done():
+            reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await reader
+
+
+async def gather_streams(
+    *streams: AsyncIterator[str],
+    max_concurrent: Optional[int] = None,
+) -> AsyncIterator[str]:
+    """Consume several streams concurrently and yield them one after another.
+
+    All streams are read at once, but their chunks are yielded in argument
+    order: the first stream is relayed live while the others are buffered,
+    and each following stream catches up with what it has already received
+    once the previous one ends. The output matches running the streams
+    sequentially while the total time is that of the slowest one.
+
+    With max_concurrent set, at most that many streams are read at a time;
+    the rest start, in argument order, as earlier ones finish.
+
+    Usage:
+        async for chunk in gather_streams(
+            shadai.summarize(),
+            shadai.query(query="...", use_memory=False),
+        ):
+            print(chunk, end="", flush=True)
+
+    Args:
+        *streams: Streams of text chunks
+        max_concurrent: Maximum number of streams read at once (default: all)
+
+    Yields:
+        Text chunks of each stream, in argument order
+    """
+    queues: "List[asyncio.Queue[object]]" = [asyncio.Queue() for _ in streams]
+    semaphore = asyncio.Semaphore(max_concurrent or max(len(streams), 1))
+
+    async def pump(stream: AsyncIterator[str], queue: "asyncio.Queue[object]") -> None:
+        try:
+            # Waiters are woken in FIFO order, so streams start in argument order
+            async with semaphore:
+                async for chunk in stream:
+                    queue.put_nowait(chunk)
+        finally:
+            await _aclose(stream)
+            queue.put_nowait(_END)
+
+    readers = [
+        asyncio.create_task(pump(stream, queue))
+        for stream, queue in zip(streams, queues)
+    ]
+
+    try:
+        for reader, queue in zip(readers, queues):
+            while (item := await queue.get()) is not _END:
+                yield str(item)
+
+            # Re-raise any error from the source stream
+            await reader
+    finally:
+        for reader in readers:
+            if not reader.done():
+                reader.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await reader
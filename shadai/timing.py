@@ -32,12 +32,12 @@ def timed(func: F) -> F:
 
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        init_time = time.time()
+        # perf_counter is monotonic, unlike time.time()
+        init_time = time.perf_counter_ns()
         try:
             return await func(*args, **kwargs)
         finally:
-            end_time = time.time()
-            elapsed = end_time - init_time
+            elapsed = (time.perf_counter_ns() - init_time) / 1e9
             print(f"\n\n⏱️  Time taken: {elapsed:.2f} seconds")
 
     return wrapper  # type: ignore
@@ -6,20 +6,30 @@ Beautiful, Pythonic interfaces for Shadai AI tools.
 
 import asyncio
 import base64
-import json
+import contextlib
+import hashlib
 import os
+from collections import Counter, deque
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Union
-
-from .client import ShadaiClient
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .cache import ResponseCache
+from .client import ShadaiClient, _env_api_key
 from .models import AgentTool, EmbeddingModel, LLMModel
 
 if TYPE_CHECKING:
     from .session import Session
 
-from dotenv import load_dotenv
-
-load_dotenv()
+_shared_instances: Dict[Tuple[Any, ...], "Shadai"] = {}
 
 
 class QueryTool:
@@ -35,16 +45,23 @@ class QueryTool:
         ...     print(chunk, end="", flush=True)
     """
 
-    def __init__(self, client: ShadaiClient, session_uuid: str) -> None:
+    def __init__(
+        self,
+        client: ShadaiClient,
+        session_uuid: str,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
         """
         Initialize Query tool.
 
         Args:
             client: Shadai client instance
             session_uuid: Your session UUID
+            cache: Optional response cache for queries made without memory
         """
         self.client = client
         self.session_uuid = session_uuid
+        self.cache = cache
 
     async def __call__(
         self,
@@ -54,6 +71,10 @@ class QueryTool:
         """
         Query the knowledge base with streaming response.
 
+        When a cache is configured, queries made with use_memory=False are
+        answered from the cache on repeat; memory-enabled queries depend on
+        the conversation history and always reach the server.
+
         Args:
             query: Your question or search query
             use_memory: Enable conversation memory
@@ -65,15 +86,23 @@ class QueryTool:
             >>> async for chunk in query_tool("Explain transformers"):
             ...     print(chunk, end="")
         """
-        async for chunk in self.client.stream_tool(
-            tool_name="shadai_query",
-            arguments={
-                "session_uuid": self.session_uuid,
-                "query": query,
-                "use_memory": use_memory,
-            },
-        ):
-            yield chunk
+        arguments = {
+            "session_uuid": self.session_uuid,
+            "query": query,
+            "use_memory": use_memory,
+        }
+        stream = self.client.stream_tool(tool_name="shadai_query", arguments=arguments)
+
+        if self.cache is not None and not use_memory:
+            stream = self.cache.stream(
+                key=ResponseCache.make_key("shadai_query", arguments),
+                session_uuid=self.session_uuid,
+                stream=stream,
+            )
+
+        async with contextlib.aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield chunk
 
 
 class SummarizeTool:
@@ -101,16 +130,23 @@ class SummarizeTool:
         ...     print(chunk, end="", flush=True)
     """
 
-    def __init__(self, client: ShadaiClient, session_uuid: str) -> None:
+    def __init__(
+        self,
+        client: ShadaiClient,
+        session_uuid: str,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
         """
         Initialize Summarize tool.
 
         Args:
             client: Shadai client instance
             session_uuid: Your session UUID
+            cache: Optional response cache for summaries made without memory
         """
         self.client = client
         self.session_uuid = session_uuid
+        self.cache = cache
 
     async def __call__(
         self,
@@ -121,6 +157,10 @@ class SummarizeTool:
         """
         Generate summary of all session documents or answer questions about them.
 
+        When a cache is configured, calls made with use_memory=False are
+        answered from the cache on repeat until the session's documents
+        change.
+
         Args:
             prompt: Optional question to answer using the summary (default: None)
             return_direct: If True, return summary directly; if False, answer the prompt (default: True)
@@ -144,16 +184,26 @@ class SummarizeTool:
             ... ):
             ...     print(chunk, end="")
         """
-        async for chunk in self.client.stream_tool(
-            tool_name="shadai_summarize",
-            arguments={
-                "session_uuid": self.session_uuid,
-                "prompt": prompt,
-                "return_direct": return_direct,
-                "use_memory": use_memory,
-            },
-        ):
-            yield chunk
+        arguments = {
+            "session_uuid": self.session_uuid,
+            "prompt": prompt,
+            "return_direct": return_direct,
+            "use_memory": use_memory,
+        }
+        stream = self.client.stream_tool(
+            tool_name="shadai_summarize", arguments=arguments
+        )
+
+        if self.cache is not None and not use_memory:
+            stream = self.cache.stream(
+                key=ResponseCache.make_key("shadai_summarize", arguments),
+                session_uuid=self.session_uuid,
+                stream=stream,
+            )
+
+        async with contextlib.aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield chunk
 
 
 class WebSearchTool:
@@ -200,7 +250,7 @@ class WebSearchTool:
             >>> async for chunk in search_tool("Current weather in Paris"):
             ...     print(chunk, end="")
         """
-        async for chunk in self.client.stream_tool(
+        stream = self.client.stream_tool(
             tool_name="shadai_web_search",
             arguments={
                 "session_uuid": self.session_uuid,
@@ -208,8 +258,10 @@ class WebSearchTool:
                 "use_web_search": use_web_search,
                 "use_memory": use_memory,
             },
-        ):
-            yield chunk
+        )
+        async with contextlib.aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield chunk
 
 
 class EngineTool:
@@ -269,7 +321,7 @@ class EngineTool:
             ... ):
             ...     print(chunk, end="")
         """
-        async for chunk in self.client.stream_tool(
+        stream = self.client.stream_tool(
             tool_name="shadai_engine",
             arguments={
                 "session_uuid": self.session_uuid,
@@ -279,8 +331,10 @@ class EngineTool:
                 "use_web_search": use_web_search,
                 "use_memory": use_memory,
             },
-        ):
-            yield chunk
+        )
+        async with contextlib.aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield chunk
 
 
 class IngestTool:
@@ -327,13 +381,17 @@ class IngestTool:
             Dictionary with successful uploads, failed uploads, and statistics
 
         Raises:
-            ValueError: If folder path doesn't exist or is not a directory
+            ValueError: If folder path doesn't exist or is not a directory,
+                or max_concurrent is less than 1
 
         Examples:
             >>> results = await ingest_tool("/path/to/docs")
             >>> print(f"Success: {len(results['successful'])}")
             >>> print(f"Failed: {len(results['failed'])}")
         """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+
         folder = Path(folder_path)
 
         if not folder.exists():
@@ -342,7 +400,7 @@ class IngestTool:
         if not folder.is_dir():
             raise ValueError(f"Path is not a directory: {folder_path}")
 
-        files_to_process = self._find_files(folder=folder)
+        files_to_process = await asyncio.to_thread(self._find_files, folder=folder)
 
         if not files_to_process:
             return {
@@ -355,27 +413,31 @@ class IngestTool:
                 "skipped_count": 0,
             }
 
-        files_to_upload = []
+        files_to_upload: List[Tuple[Path, int]] = []
         skipped_files = []
 
-        for file_path in files_to_process:
-            file_size = file_path.stat().st_size
+        for file_path, file_size in files_to_process:
             if file_size > self.MAX_FILE_SIZE_BYTES:
-                size_mb = file_size / (1024 * 1024)
+                size_mb = f"{file_size / (1024 * 1024):.2f} MB"
                 skipped_files.append(
                     {
                         "file_path": str(file_path),
                         "filename": file_path.name,
                         "size": file_size,
-                        "size_mb": f"{size_mb:.2f} MB",
-                        "reason": f"""
-                            File size ({size_mb:.2f} MB) exceeds maximum allowed 
-                            size ({self.MAX_FILE_SIZE_MB} MB)
-                        """,
+                        "size_mb": size_mb,
+                        "reason": (
+                            f"File size ({size_mb}) exceeds maximum allowed "
+                            f"size ({self.MAX_FILE_SIZE_MB} MB)"
+                        ),
                     }
                 )
             else:
-                files_to_upload.append(file_path)
+                files_to_upload.append((file_path, file_size))
+
+        files_to_upload, duplicate_files = await asyncio.to_thread(
+            self._deduplicate, files_to_upload
+        )
+        skipped_files.extend(duplicate_files)
 
         results = await self._ingest_files(
             files=files_to_upload, max_concurrent=max_concurrent
@@ -386,28 +448,100 @@ class IngestTool:
 
         return results
 
-    def _find_files(self, folder: Path) -> List[Path]:
+    def _find_files(self, folder: Path) -> List[Tuple[Path, int]]:
         """
         Recursively find all supported files in folder.
 
+        Walks the tree with os.scandir, whose directory entries carry the
+        file type, so only supported files cost a stat() call (for their size).
+        Directories that cannot be read are skipped.
+
         Args:
             folder: Folder path to search
 
         Returns:
-            List of file paths with supported extensions
+            List of (file path, size in bytes) tuples for supported files
         """
-        files = []
-        for item in folder.rglob("*"):
-            if item.is_file() and item.suffix.lower() in self.SUPPORTED_EXTENSIONS:
-                files.append(item)
+        files: List[Tuple[Path, int]] = []
+        pending = deque([folder])
+        while pending:
+            try:
+                scan = os.scandir(pending.popleft())
+            except OSError:
+                continue
+            with scan as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif (
+                        os.path.splitext(entry.name)[1].lower()
+                        in self.SUPPORTED_EXTENSIONS
+                        and entry.is_file()
+                    ):
+                        files.append((Path(entry.path), entry.stat().st_size))
         return files
 
-    def _create_batches(self, files: List[Path]) -> List[List[Path]]:
+    @staticmethod
+    def _deduplicate(
+        files: List[Tuple[Path, int]],
+    ) -> Tuple[List[Tuple[Path, int]], List[Dict[str, Any]]]:
+        """
+        Drop files whose content is identical to an earlier file.
+
+        Only files that share their size with another file are hashed, so
+        folders without duplicates are not read here at all.
+
+        Args:
+            files: List of (file path, size in bytes) pairs
+
+        Returns:
+            Tuple of (unique files, skipped entries for the duplicates)
+        """
+        size_counts = Counter(file_size for _, file_size in files)
+        seen: Dict[Tuple[int, str], Path] = {}
+        unique_files: List[Tuple[Path, int]] = []
+        duplicate_files: List[Dict[str, Any]] = []
+
+        for file_path, file_size in files:
+            if size_counts[file_size] < 2:
+                unique_files.append((file_path, file_size))
+                continue
+
+            try:
+                digest = hashlib.sha256()
+                with open(file_path, "rb") as f:
+                    for block in iter(lambda: f.read(1024 * 1024), b""):
+                        digest.update(block)
+            except OSError:
+                # Let the upload report unreadable files
+                unique_files.append((file_path, file_size))
+                continue
+
+            original = seen.setdefault((file_size, digest.hexdigest()), file_path)
+            if original is file_path:
+                unique_files.append((file_path, file_size))
+            else:
+                duplicate_files.append(
+                    {
+                        "file_path": str(file_path),
+                        "filename": file_path.name,
+                        "size": file_size,
+                        "size_mb": f"{file_size / (1024 * 1024):.2f} MB",
+                        "reason": f"Duplicate of {original}",
+                    }
+                )
+
+        return unique_files, duplicate_files
+
+    def _create_batches(self, files: List[Tuple[Path, int]]) -> List[List[Path]]:
         """
         Batch files into groups with maximum total size of MAX_BATCH_SIZE_BYTES.
 
+        File sizes are taken from the folder scan so batching does not stat
+        every file a second time.
+
         Args:
-            files: List of file paths to batch
+            files: List of (file path, size in bytes) pairs to batch
 
         Returns:
             List of batches, where each batch is a list of file paths
@@ -416,9 +550,7 @@ class IngestTool:
         current_batch: List[Path] = []
         current_batch_size = 0
 
-        for file_path in files:
-            file_size = file_path.stat().st_size
-
+        for file_path, file_size in files:
             # If adding this file would exceed the batch limit, start a new batch
             if (
                 current_batch
@@ -438,7 +570,7 @@ class IngestTool:
         return batches
 
     async def _ingest_files(
-        self, files: List[Path], max_concurrent: int
+        self, files: List[Tuple[Path, int]], max_concurrent: int
     ) -> Dict[str, Any]:
         """
         Ingest multiple files concurrently with batching by size.
@@ -447,7 +579,7 @@ class IngestTool:
         then processes each batch as a single API call.
 
         Args:
-            files: List of file paths to process
+            files: List of (file path, size in bytes) pairs to process
             max_concurrent: Maximum concurrent batch uploads
 
         Returns:
@@ -509,44 +641,56 @@ class IngestTool:
         """
         async with semaphore:
             try:
-                # Prepare all files in the batch
-                files_data = []
-                for file_path in batch:
-                    try:
-                        file_data = file_path.read_bytes()
-                        file_base64 = base64.b64encode(file_data).decode("utf-8")
-                        files_data.append(
-                            {
-                                "file_base64": file_base64,
-                                "filename": file_path.name,
-                                "file_path": str(file_path),
-                            }
-                        )
-                    except Exception as e:
-                        # If a file fails to read, add it to failed list but continue with others
-                        files_data.append(
-                            {
-                                "file_path": str(file_path),
-                                "filename": file_path.name,
-                                "error": f"Failed to read file: {str(e)}",
-                            }
-                        )
+                # Read and encode the batch in worker threads so large files
+                # don't block the event loop
+                files_data = await asyncio.gather(
+                    *(
+                        asyncio.to_thread(self._encode_file, file_path)
+                        for file_path in batch
+                    )
+                )
 
                 # Call the batch ingest tool
-                result = await self.client.call_tool(
+                return await self.client.call_tool_json(
                     tool_name="ingest_files_batch",
                     arguments={
                         "session_uuid": self.session_uuid,
                         "files": files_data,
                     },
                 )
-                return json.loads(result)
 
             except Exception as e:
                 raise Exception(
                     f"Failed to process batch of {len(batch)} files: {str(e)}"
                 ) from e
 
+    @staticmethod
+    def _encode_file(file_path: Path) -> Dict[str, str]:
+        """
+        Read a file and encode it as base64 for upload.
+
+        Args:
+            file_path: Path of the file to encode
+
+        Returns:
+            File payload for the batch ingest tool, or an error entry if the
+            file could not be read
+        """
+        try:
+            file_data = file_path.read_bytes()
+            return {
+                "file_base64": base64.b64encode(file_data).decode("utf-8"),
+                "filename": file_path.name,
+                "file_path": str(file_path),
+            }
+        except Exception as e:
+            # If a file fails to read, report it but continue with the others
+            return {
+                "file_path": str(file_path),
+                "filename": file_path.name,
+                "error": f"Failed to read file: {str(e)}",
+            }
+
 
 class _AgentOrchestrator:
     """
@@ -575,6 +719,7 @@ class _AgentOrchestrator:
         prompt: str,
         tools: List[AgentTool],
         session_uuid: str,
+        parallel_tools: bool = False,
     ) -> AsyncIterator[str]:
         """
         Execute agentic workflow: plan → execute → synthesize.
@@ -583,27 +728,18 @@ class _AgentOrchestrator:
             prompt: User's question or task
             tools: List of AgentTool objects with name, description, implementation, and arguments
             session_uuid: Session UUID for context and memory
+            parallel_tools: Run the planned tools concurrently instead of in plan order
 
         Yields:
             Text chunks from the synthesized final answer
         """
-        import inspect
-        import json
-
         # Convert list to dictionary for lookup
         tools_dict: Dict[str, AgentTool] = {tool.name: tool for tool in tools}
 
         # Step 1: Plan - Get tool selection from server
-        tool_definitions = [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "parameters": tool.parameters,
-            }
-            for tool in tools_dict.values()
-        ]
+        tool_definitions = [tool.definition for tool in tools_dict.values()]
 
-        plan_result = await self.client.call_tool(
+        plan = await self.client.call_tool_json(
             tool_name="shadai_planner",
             arguments={
                 "prompt": prompt,
@@ -611,58 +747,25 @@ class _AgentOrchestrator:
                 "session_uuid": session_uuid,
             },
         )
-        plan = json.loads(plan_result)
 
         # Step 2: Execute - Run selected tools locally with inferred arguments
-        tool_executions = []
-
-        for tool_item in plan["tool_plan"]:
-            tool_name = tool_item["name"]
-            # Use inferred arguments from planner
-            inferred_args = tool_item.get("arguments", {})
-
-            if tool_name not in tools_dict:
-                # Tool not available, record error
-                tool_executions.append(
-                    {
-                        "tool_name": tool_name,
-                        "arguments": inferred_args,
-                        "output": f"Error: Tool '{tool_name}' not found in provided tools",
-                    }
-                )
-                continue
-
-            tool = tools_dict[tool_name]
-            tool_impl = tool.implementation
-
-            # Merge user-provided arguments with inferred arguments (inferred takes precedence)
-            final_args = {**tool.arguments, **inferred_args}
-
-            # Execute the tool implementation with final arguments
-            try:
-                if inspect.iscoroutinefunction(tool_impl):
-                    result = await tool_impl(**final_args)
-                else:
-                    result = tool_impl(**final_args)
-
-                tool_executions.append(
-                    {
-                        "tool_name": tool_name,
-                        "arguments": final_args,
-                        "output": str(result),
-                    }
-                )
-            except Exception as e:
-                tool_executions.append(
-                    {
-                        "tool_name": tool_name,
-                        "arguments": final_args,
-                        "output": f"Error executing tool: {str(e)}",
-                    }
+        if parallel_tools:
+            tool_executions = list(
+                await asyncio.gather(
+                    *(
+                        self._execute_tool(tools_dict=tools_dict, tool_item=tool_item)
+                        for tool_item in plan["tool_plan"]
+                    )
                 )
+            )
+        else:
+            tool_executions = [
+                await self._execute_tool(tools_dict=tools_dict, tool_item=tool_item)
+                for tool_item in plan["tool_plan"]
+            ]
 
         # Step 3: Synthesize - Combine outputs via server
-        async for chunk in self.client.stream_tool(
+        stream = self.client.stream_tool(
             tool_name="shadai_synthesizer",
             arguments={
                 "prompt": prompt,
@@ -670,8 +773,66 @@ class _AgentOrchestrator:
                 "tool_executions": tool_executions,
                 "session_uuid": session_uuid,
             },
-        ):
-            yield chunk
+        )
+        async with contextlib.aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield chunk
+
+    @staticmethod
+    async def _execute_tool(
+        tools_dict: Dict[str, AgentTool], tool_item: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Execute one planned tool call.
+
+        Args:
+            tools_dict: Available tools by name
+            tool_item: Planner entry with the tool name and inferred arguments
+
+        Returns:
+            Tool execution record with tool name, arguments and output
+        """
+        import inspect
+
+        tool_name = tool_item["name"]
+        # Use inferred arguments from planner
+        inferred_args = tool_item.get("arguments", {})
+
+        if tool_name not in tools_dict:
+            # Tool not available, record error
+            return {
+                "tool_name": tool_name,
+                "arguments": inferred_args,
+                "output": f"Error: Tool '{tool_name}' not found in provided tools",
+            }
+
+        tool = tools_dict[tool_name]
+        tool_impl = tool.implementation
+
+        # Merge user-provided arguments with inferred arguments (inferred takes precedence)
+        final_args = {**tool.arguments, **inferred_args}
+
+        # Execute the tool implementation with final arguments. Sync tools
+        # run on the caller's thread unless they opted into a worker thread
+        try:
+            if inspect.iscoroutinefunction(tool_impl):
+                result = await tool_impl(**final_args)
+            elif tool.run_in_thread:
+                result = await asyncio.to_thread(tool_impl, **final_args)
+            else:
+                result = tool_impl(**final_args)
+
+            return {
+                "tool_name": tool_name,
+                "arguments": final_args,
+                "output": str(result),
+            }
+        except Exception as e:
+            return {
+                "tool_name": tool_name,
+                "arguments": final_args,
+                "output": f"Error executing tool: {str(e)}",
+            }
 
 
 class Shadai:
@@ -722,6 +883,7 @@ class Shadai:
         base_url: str = "http://localhost",
         timeout: int = 30,
         system_prompt: Optional[str] = None,
+        cache_size: int = 0,
     ) -> None:
         """
         Initialize Shadai client with session management.
@@ -735,6 +897,8 @@ class Shadai:
             system_prompt: Optional system prompt for the session
             llm_model: Optional LLM model (e.g., LLMModel.OPENAI_GPT_4O_MINI)
             embedding_model: Optional embedding model (e.g., EmbeddingModel.OPENAI_TEXT_EMBEDDING_3_SMALL)
+            cache_size: Number of memory-less responses to cache in-process
+                (default: 0, caching disabled)
 
         Examples:
             >>> from shadai import Shadai, LLMModel, EmbeddingModel
@@ -760,7 +924,7 @@ class Shadai:
             ...         print(chunk, end="")
         """
         if not api_key:
-            api_key = os.getenv("SHADAI_API_KEY")
+            api_key = _env_api_key()
             if not api_key:
                 raise ValueError("API key not provided")
 
@@ -775,36 +939,164 @@ class Shadai:
         self._llm_model = llm_model
         self._embedding_model = embedding_model
         self._session: Optional["Session"] = None
+        self._cache = ResponseCache(maxsize=cache_size) if cache_size else None
+        self._context_count = 0
+        self._context_lock = asyncio.Lock()
+        self._shared_key: Optional[Tuple[Any, ...]] = None
+
+    @classmethod
+    def get_or_create(
+        cls,
+        name: Optional[str] = None,
+        llm_model: Optional[Union[str, LLMModel]] = None,
+        embedding_model: Optional[Union[str, EmbeddingModel]] = None,
+        temporal: bool = False,
+        api_key: Optional[str] = None,
+        base_url: str = "http://localhost",
+        timeout: int = 30,
+        system_prompt: Optional[str] = None,
+        cache_size: int = 0,
+    ) -> "Shadai":
+        """
+        Get a process-wide shared instance for the given configuration.
+
+        Calls with the same arguments return the same instance, so scripts
+        and coroutines using it share one session. Exiting the context does
+        not close a shared session; call reset() to tear it down. Temporal
+        sessions are the exception: they are deleted when the last context
+        exits, as with a plain Shadai instance.
+
+        Args:
+            Same as Shadai()
+
+        Returns:
+            Shared Shadai instance
+
+        Examples:
+            >>> async with Shadai.get_or_create(name="my-session") as shadai:
+            ...     async for chunk in shadai.query(query="What is AI?"):
+            ...         print(chunk, end="")
+            >>>
+            >>> # Later: same instance, session is already set up
+            >>> async with Shadai.get_or_create(name="my-session") as shadai:
+            ...     await shadai.reset()
+        """
+        key = (
+            name,
+            llm_model,
+            embedding_model,
+            temporal,
+            api_key,
+            base_url,
+            timeout,
+            system_prompt,
+            cache_size,
+        )
+        instance = _shared_instances.get(key)
+        if instance is None:
+            instance = cls(
+                name=name,
+                llm_model=llm_model,
+                embedding_model=embedding_model,
+                temporal=temporal,
+                api_key=api_key,
+                base_url=base_url,
+                timeout=timeout,
+                system_prompt=system_prompt,
+                cache_size=cache_size,
+            )
+            instance._shared_key = key
+            _shared_instances[key] = instance
+        return instance
 
     async def __aenter__(self) -> "Shadai":
         """Enter context: initialize session.
 
+        The context is re-entrant: nested or concurrent entries share the
+        session, which is set up on the first entry only.
+
         Returns:
             Shadai instance with active session
         """
         from .session import Session
 
-        self._session = Session(
-            name=self._session_name,
-            temporal=self._temporal,
-            client=self.client,
-            system_prompt=self._system_prompt,
-            llm_model=self._llm_model,
-            embedding_model=self._embedding_model,
-        )
-        await self._session.__aenter__()
+        async with self._context_lock:
+            if self._context_count == 0:
+                # Keep pooled connections for the lifetime of the context
+                await self.client.__aenter__()
+            try:
+                if self._session is None:
+                    session = Session(
+                        name=self._session_name,
+                        temporal=self._temporal,
+                        client=self.client,
+                        system_prompt=self._system_prompt,
+                        llm_model=self._llm_model,
+                        embedding_model=self._embedding_model,
+                    )
+                    await session.__aenter__()
+                    self._session = session
+            except BaseException:
+                # No context will exit to release the client's HTTP session
+                if self._context_count == 0:
+                    await self.client.__aexit__(None, None, None)
+                raise
+            self._context_count += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit context: cleanup session.
+        """Exit context: cleanup session once the last context exits.
+
+        Shared instances from get_or_create() keep their session open until
+        reset() is called, unless it is temporal. Pooled HTTP connections are
+        closed either way.
 
         Args:
             exc_type: Exception type if raised
             exc_val: Exception value if raised
             exc_tb: Exception traceback if raised
         """
-        if self._session:
-            await self._session.__aexit__(exc_type, exc_val, exc_tb)
+        async with self._context_lock:
+            self._context_count = max(self._context_count - 1, 0)
+            if self._context_count > 0:
+                return
+
+            try:
+                if self._shared_key is None or self._temporal:
+                    self._unshare()
+                    session, self._session = self._session, None
+                    if session:
+                        await session.__aexit__(exc_type, exc_val, exc_tb)
+            finally:
+                await self.client.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def reset(self) -> None:
+        """
+        Tear down the session, deleting it if temporal.
+
+        Shared instances are also removed from the get_or_create() registry.
+
+        Examples:
+            >>> shadai = Shadai.get_or_create(name="scratch")
+            >>> async with shadai:
+            ...     await shadai.ingest(folder_path="./docs")
+            >>> await shadai.reset()
+        """
+        async with self._context_lock:
+            self._unshare()
+            self._context_count = 0
+            session, self._session = self._session, None
+            try:
+                if session:
+                    await session.__aexit__(None, None, None)
+            finally:
+                await self.client.close()
+
+    def _unshare(self) -> None:
+        """Remove this instance from the get_or_create() registry."""
+        if self._shared_key is not None:
+            _shared_instances.pop(self._shared_key, None)
+            self._shared_key = None
 
     async def health(self) -> Dict[str, Any]:
         """
@@ -856,9 +1148,13 @@ class Shadai:
         if not self._session:
             raise ValueError("Shadai must be used as a context manager")
 
-        query_tool = QueryTool(client=self.client, session_uuid=self._session.uuid)
-        async for chunk in query_tool(query=query, use_memory=use_memory):
-            yield chunk
+        query_tool = QueryTool(
+            client=self.client, session_uuid=self._session.uuid, cache=self._cache
+        )
+        stream = query_tool(query=query, use_memory=use_memory)
+        async with contextlib.aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield chunk
 
     async def summarize(
         self,
@@ -902,14 +1198,16 @@ class Shadai:
             raise ValueError("Shadai must be used as a context manager")
 
         summarize_tool = SummarizeTool(
-            client=self.client, session_uuid=self._session.uuid
+            client=self.client, session_uuid=self._session.uuid, cache=self._cache
         )
-        async for chunk in summarize_tool(
+        stream = summarize_tool(
             prompt=prompt,
             return_direct=return_direct,
             use_memory=use_memory,
-        ):
-            yield chunk
+        )
+        async with contextlib.aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield chunk
 
     async def web_search(
         self,
@@ -937,12 +1235,14 @@ class Shadai:
             raise ValueError("Shadai must be used as a context manager")
 
         search_tool = WebSearchTool(client=self.client, session_uuid=self._session.uuid)
-        async for chunk in search_tool(
+        stream = search_tool(
             prompt=prompt,
             use_web_search=use_web_search,
             use_memory=use_memory,
-        ):
-            yield chunk
+        )
+        async with contextlib.aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield chunk
 
     async def engine(
         self,
@@ -977,19 +1277,22 @@ class Shadai:
             raise ValueError("Shadai must be used as a context manager")
 
         engine_tool = EngineTool(client=self.client, session_uuid=self._session.uuid)
-        async for chunk in engine_tool(
+        stream = engine_tool(
             prompt=prompt,
             use_knowledge_base=use_knowledge_base,
             use_summary=use_summary,
             use_web_search=use_web_search,
             use_memory=use_memory,
-        ):
-            yield chunk
+        )
+        async with contextlib.aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield chunk
 
     async def agent(
         self,
         prompt: str,
         tools: List[AgentTool],
+        parallel_tools: bool = False,
     ) -> AsyncIterator[str]:
         """
         Execute intelligent agent workflow: plan → execute → synthesize.
@@ -1002,6 +1305,9 @@ class Shadai:
         Args:
             prompt: User's question or task
             tools: List of AgentTool objects
+            parallel_tools: Run the planned tools concurrently instead of in
+                plan order; only for tools that don't depend on each other
+                (default: False)
 
         Yields:
             Text chunks from the synthesized response
@@ -1037,12 +1343,17 @@ class Shadai:
             raise ValueError("Shadai must be used as a context manager")
 
         orchestrator = _AgentOrchestrator(client=self.client)
-        async for chunk in orchestrator(
-            prompt=prompt, tools=tools, session_uuid=self._session.uuid
-        ):
-            yield chunk
+        stream = orchestrator(
+            prompt=prompt,
+            tools=tools,
+            session_uuid=self._session.uuid,
+            parallel_tools=parallel_tools,
+        )
+        async with contextlib.aclosing(stream) as chunks:
+            async for chunk in chunks:
+                yield chunk
 
-    async def ingest(self, folder_path: str) -> Dict[str, Any]:
+    async def ingest(self, folder_path: str, max_concurrent: int = 5) -> Dict[str, Any]:
         """
         Ingest all PDF and image files in a folder (including nested folders).
 
@@ -1051,6 +1362,7 @@ class Shadai:
 
         Args:
             folder_path: Path to the folder containing files to process
+            max_concurrent: Maximum number of concurrent batch uploads (default: 5)
 
         Returns:
             Dictionary with processing results:
@@ -1060,6 +1372,9 @@ class Shadai:
             - successful_count: Count of successful uploads
             - failed_count: Count of failed uploads
 
+        Raises:
+            ValueError: If max_concurrent is less than 1
+
         Examples:
             >>> async with Shadai(name="my-session") as shadai:
             ...     results = await shadai.ingest(
@@ -1072,8 +1387,17 @@ class Shadai:
             ...     for failed in results['failed']:
             ...         print(f"Failed: {failed['filename']} - {failed['error']}")
         """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
         if not self._session:
             raise ValueError("Shadai must be used as a context manager")
 
         ingest_tool = IngestTool(client=self.client, session_uuid=self._session.uuid)
-        return await ingest_tool(folder_path=folder_path)
+        try:
+            return await ingest_tool(
+                folder_path=folder_path, max_concurrent=max_concurrent
+            )
+        finally:
+            # New documents change the answers, so drop cached responses
+            if self._cache is not None:
+                self._cache.invalidate(session_uuid=self._session.uuid)